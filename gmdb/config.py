@@ -3,6 +3,7 @@
 # stdlib imports
 import copy
 import os.path
+import stat
 
 # third party imports
 import yaml
@@ -10,23 +11,45 @@ import yaml
 # local imports
 from gmdb.constants import CONFIG_FILE, DEFAULT_CONFIG
 
+# Parsed configs keyed by (path, mtime_ns, size) of the config file
+_CONFIG_CACHE = {}
+
 
 def get_config():
     """Gets the user defined config and validates it.
 
     Notes:
         If no config file is present, default parameters are used.
+        The parsed config is cached until the config file is modified.
 
     Returns:
         dictionary: Configuration parameters.
     """
     config_file = os.path.join(os.path.expanduser('~'), CONFIG_FILE)
-    if not os.path.isfile(config_file):
+    try:
+        st = os.stat(config_file)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
+        cache_key = None
+    else:
+        cache_key = (config_file, st.st_mtime_ns, st.st_size)
+    if cache_key in _CONFIG_CACHE:
+        return copy.deepcopy(_CONFIG_CACHE[cache_key])
+    if cache_key is None:
         config = DEFAULT_CONFIG
     else:
-        config = yaml.safe_load(open(config_file, 'rt'))
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        with open(config_file, 'rt') as f:
+            config = yaml.load(f, Loader=loader)
         _validate_config(config)
-    return config
+    _CONFIG_CACHE.clear()
+    _CONFIG_CACHE[cache_key] = config
+    return copy.deepcopy(config)
+
+def invalidate_config_cache():
+    """Clears the cached config so the next get_config call rereads it."""
+    _CONFIG_CACHE.clear()
 
 def _validate_config(config):
     """Helper to validate user defined config.
@@ -40,31 +63,35 @@ def _validate_config(config):
     """
     if not isinstance(config, dict):
         raise TypeError("Config is empty or is populated incorrectly.")
-    config_keys = _get_keys(copy.deepcopy(config), [])
-    default_keys = _get_keys(copy.deepcopy(DEFAULT_CONFIG), [])
-    # Only look for differences in processing_parameters and pgm lists
-    # The user should be able to use EventSummary for processing and analysis
-    # without providing database info
-    excluded_keys = ['comcat', 'host', 'scp', 'remote_host', 'keyfile', 'pdl',
-            'java', 'jarfile', 'privatekey', 'configfile', 'product_source']
-    difference = [key for key in default_keys if (key not in config_keys and
-            key not in excluded_keys)]
+    config_keys = _get_keys(config)
+    difference = [key for key in _REQUIRED_KEYS if key not in config_keys]
     if len(difference) > 0:
         raise KeyError('Missing required parameters %r.' % difference)
 
-def _get_keys(config_dict, keys):
-    """Helper to get a list of all keys in the dictionary.
+def _get_keys(config_dict):
+    """Helper to get the set of all leaf keys in a nested dictionary.
 
     Args:
         config_dict (dictionary): Dictionary of config.
-        keys (list): list of keys (str).
 
     Returns:
-        list: list of keys (str).
+        set: Set of keys (str).
     """
-    for k, v in config_dict.items():
-        if isinstance(v, dict):
-            _get_keys(v, keys=keys)
-        else:
-            keys += [k]
+    keys = set()
+    stack = [config_dict]
+    while stack:
+        for k, v in stack.pop().items():
+            if isinstance(v, dict):
+                stack.append(v)
+            else:
+                keys.add(k)
     return keys
+
+
+# Only look for differences in processing_parameters and pgm lists
+# The user should be able to use EventSummary for processing and analysis
+# without providing database info
+_EXCLUDED_KEYS = frozenset(['comcat', 'host', 'scp', 'remote_host',
+        'keyfile', 'pdl', 'java', 'jarfile', 'privatekey', 'configfile',
+        'product_source'])
+_REQUIRED_KEYS = sorted(_get_keys(DEFAULT_CONFIG) - _EXCLUDED_KEYS)
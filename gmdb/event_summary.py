@@ -1,9 +1,10 @@
 # stdlib imports
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import copy
 import datetime
-import glob
-import json
+import functools
+import math
 import os
 import warnings
 
@@ -21,6 +22,39 @@ from pgm.station_summary import StationSummary
 # local imports
 from gmdb.config import get_config
 from gmdb.constants import TIMEFMT
+from gmdb.json_utils import dumps_json, loads_json
+
+
+def _pgm_array(values):
+    """Convert pgm values to a float array, or an object array if any value
+    is not numeric (e.g. 'null' read from products)."""
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        return values
+    try:
+        return np.array(values, dtype=float)
+    except (TypeError, ValueError):
+        return np.array(values, dtype=object)
+
+
+def _pgm_matrix(pgms, imc_keys, imt_keys):
+    """Gather pgm values into an array with one row per imc and one column
+    per imt, filled without building intermediate lists."""
+    shape = (len(imc_keys), len(imt_keys))
+    values = (pgms[imt_key][imc_key] for imc_key in imc_keys
+            for imt_key in imt_keys)
+    try:
+        return np.fromiter(values, dtype=float,
+                count=shape[0] * shape[1]).reshape(shape)
+    except (TypeError, ValueError):
+        # Values read from products may hold 'null' in place of NaN
+        return np.array([pgms[imt_key][imc_key] for imc_key in imc_keys
+                for imt_key in imt_keys], dtype=object).reshape(shape)
+
+
+def _summarize_stream(stream, imcs, imts):
+    """Calculate the StationSummary of one stream; defined at module level
+    so that it can be sent to worker processes."""
+    return StationSummary.from_stream(stream, imcs, imts)
 
 
 class EventSummary(object):
@@ -38,9 +72,13 @@ class EventSummary(object):
         Returns:
             dictionary: Corrected streams (obspy.core.stream.Stream)
 
+        Notes:
+            The dictionary is a shallow copy. The streams are shared with this
+            EventSummary and should not be modified in place.
         """
-        streams = copy.deepcopy(self._corrected_streams)
-        return streams
+        if self._corrected_streams is None:
+            return None
+        return copy.copy(self._corrected_streams)
 
     @corrected_streams.setter
     def corrected_streams(self, streams):
@@ -49,15 +87,21 @@ class EventSummary(object):
 
         Args:
             streams (dictionary): Corrected streams (obspy.core.stream.Stream)
+
+        Notes:
+            The dictionary is stored without copying, so the EventSummary
+            takes ownership of it and its streams.
         """
-        if self.station_dict is None or len(streams) == len(self.station_dict):
+        if (self._station_dict is None or
+                len(streams) == len(self._station_dict)):
             self._corrected_streams = streams
         else:
             warnings.warn('Stream dictionary is not the same length as the '
                     'number of stations. Setting failed.', Warning)
 
     @classmethod
-    def fromFiles(cls, directory, imcs=None, imts=None, process=True):
+    def fromFiles(cls, directory, imcs=None, imts=None, process=True,
+            nprocs=1):
         """
         Read files from a directory and return an EventSummary object.
 
@@ -68,14 +112,22 @@ class EventSummary(object):
             imts (list): List of intensity measurement types (str). Default
                     is None.
             process (bool): Whether or not to process the streams.
+            nprocs (int): Number of processes used to process the streams and
+                    calculate the station summaries. Default is 1, which does
+                    both serially in this process. None uses the number of
+                    CPUs. See process for the requirements of more than one
+                    process.
 
         Returns:
             EventSummary: EventSummary object.
         """
-        streams = []
+        # scan the directory once, skipping hidden files as glob does
+        file_paths = [entry.path for entry in os.scandir(directory)
+                if not entry.name.startswith('.')]
         # gather streams so that they can be grouped
-        for file_path in glob.glob(directory + '/*'):
-            streams += [read_data(file_path)]
+        # reading is dominated by disk latency, so overlap it with threads
+        with ThreadPoolExecutor() as executor:
+            streams = list(executor.map(read_data, file_paths))
         streams = group_channels(streams)
         uncorrected_streams = {}
         for stream in streams:
@@ -84,9 +136,9 @@ class EventSummary(object):
         event = cls()
         event.uncorrected_streams = uncorrected_streams
         if process:
-            event.process()
+            event.process(nprocs=nprocs)
             # create dictionary of StationSummary objects for use by other methods
-            event.setStationDictionary(imcs, imts)
+            event.setStationDictionary(imcs, imts, nprocs=nprocs)
         return event
 
     @classmethod
@@ -106,23 +158,38 @@ class EventSummary(object):
         # gather streams so that they can be grouped
         station_dict = OrderedDict()
         uncorrected_streams = {}
-        for file_path in glob.glob(directory + '/*'):
-            if file_path.find('.json') < 0:
-                stream = read(file_path)
-                file_name = os.path.basename(file_path).split('.')[0]
-                json_path = os.path.join(directory, file_name + '.json')
-                if not os.path.isfile(json_path):
+        # Scan the directory once, matching glob's exclusion of hidden files,
+        # and look up parametric files from the listing
+        entries = [entry for entry in os.scandir(directory)
+                if not entry.name.startswith('.')]
+        json_entries = {entry.name: entry for entry in entries
+                if entry.name.endswith('.json')}
+        # Pair each stream with its parametric file before reading anything
+        products = []
+        for entry in entries:
+            if not entry.name.endswith('.json'):
+                file_name = entry.name.split('.')[0]
+                json_entry = json_entries.get(file_name + '.json')
+                if json_entry is None or not json_entry.is_file():
                     raise FileNotFoundError('No parametric data available for '
-                            'this stream: %r.' % file_path)
-                with open(json_path) as f:
-                    parametric = json.load(f)
+                            'this stream: %r.' % entry.path)
+                products.append((entry.path, json_entry.path))
+
+        def read_product(paths):
+            file_path, json_path = paths
+            stream = read(file_path)
+            with open(json_path, 'rb') as f:
+                parametric = loads_json(f.read())
+            return stream, parametric
+
+        # Each product is read and parsed independently, so overlap them
+        with ThreadPoolExecutor() as executor:
+            for stream, parametric in executor.map(read_product, products):
+                channels = parametric['properties']['channels']
                 for trace in stream:
-                    trace_channel = trace.stats['channel']
-                    for channel in parametric['properties']['channels']:
-                        chdict = parametric['properties']['channels'][channel]
-                        channel_stats = chdict['stats']
-                        if trace_channel == channel:
-                            trace.stats = channel_stats
+                    chdict = channels.get(trace.stats['channel'])
+                    if chdict is not None:
+                        trace.stats = chdict['stats']
                 station = stream[0].stats['station']
                 pgms = parametric['properties']['pgms']
                 station_dict[station] = StationSummary.from_pgms(
@@ -149,12 +216,12 @@ class EventSummary(object):
             channel_code = trace.stats['channel']
             channel_metadata = {}
             if 'processing_parameters' in trace.stats:
-                processing = copy.deepcopy(trace.stats['processing_parameters'])
+                processing = trace.stats['processing_parameters']
                 channel_metadata['processing_parameters'] = processing
-            stats = {}
-            for key in trace.stats:
-                if key != 'processing_parameters':
-                    stats[key] = copy.deepcopy(trace.stats[key])
+            # _cleanStats builds new dictionaries, so a shallow copy is
+            # enough to keep the trace stats untouched
+            stats = {key: value for key, value in trace.stats.items()
+                    if key != 'processing_parameters'}
             channel_metadata['stats'] = stats
             channels[channel_code] = channel_metadata
         return channels
@@ -170,16 +237,25 @@ class EventSummary(object):
         Raises:
             Exception if no station dictionary has been set.
         """
-        if self.station_dict is None:
+        if self._station_dict is None:
             raise Exception('The station dictionary has not been set. Use '
                 'setStationDictionary.')
-        stations_obj = copy.deepcopy(self.station_dict)
-        flat_list = []
-        for station_key in self.stations:
-            station = stations_obj[station_key]
-            flat_rows = self.getFlatfileRow(station)
-            flat_list += [flat_rows]
-        all_rows = pd.concat(flat_list).reset_index(drop=True)
+        station_columns = [self._getFlatfileColumns(
+                self._station_dict[station_key])
+                for station_key in self.stations]
+        headers = list(station_columns[0])
+        if any(list(columns) != headers for columns in station_columns[1:]):
+            # Stations with different pgms need pandas to align the columns
+            flat_list = [pd.DataFrame(data=columns)
+                    for columns in station_columns]
+            return pd.concat(flat_list, ignore_index=True)
+        # Join each column across stations once instead of concatenating
+        # one dataframe per station
+        dataframe_dict = OrderedDict()
+        for header in headers:
+            dataframe_dict[header] = np.concatenate(
+                    [columns[header] for columns in station_columns])
+        all_rows = pd.DataFrame(data=dataframe_dict, copy=False)
         return all_rows
 
     def getFlatfileRow(self, station):
@@ -205,73 +281,45 @@ class EventSummary(object):
                 - All requested PGM values (one type per column)
                 ...
         """
-        pgms = copy.deepcopy(station.pgms)
-        dataframe_dict = OrderedDict()
-        # Initialize dataframe headers
-        columns = ['YEAR', 'MODY', 'HRMN',
-                'Station Name', 'Station ID  No.', 'Station Latitude',
-                'Station Longitude', 'Channel']
-        imt_keys = [val for val in pgms]
-        for imt_key in np.sort(imt_keys):
-            columns += [imt_key]
-        for col in columns:
-            dataframe_dict[col] = []
-        imc_keys = [val for val in pgms[imt_keys[0]]]
-        # Set metadata
-        stats = station.stream[0].stats
-        counter = 0
-        for imc in np.sort(imc_keys):
-            counter += 1
-            dataframe_dict['YEAR'] += [stats['starttime'].year]
-            # Format the date
-            month = '{:02d}'.format(stats['starttime'].month)
-            day = '{:02d}'.format(stats['starttime'].day)
-            dataframe_dict['MODY'] += [month + day]
-            hour = '{:02d}'.format(stats['starttime'].hour)
-            minute = '{:02d}'.format(stats['starttime'].minute)
-            dataframe_dict['HRMN'] += [hour + minute]
-            station_str = stats['standard']['station_name']
-            dataframe_dict['Station Name'] += [station_str]
-            dataframe_dict['Station ID  No.'] += [stats['station']]
-            latitude = stats['coordinates']['latitude']
-            dataframe_dict['Station Latitude'] += [latitude]
-            longitude = stats['coordinates']['longitude']
-            dataframe_dict['Station Longitude'] += [longitude]
-            dataframe_dict['Channel'] += [imc]
-            for imt_key in np.sort(imt_keys):
-                dataframe_dict[imt_key] += [pgms[imt_key][imc]]
-        # Create pandas dataframe
-        dataframe = pd.DataFrame(data=dataframe_dict)
+        dataframe = pd.DataFrame(data=self._getFlatfileColumns(station),
+                copy=False)
         return dataframe
 
-    def getParametric(self, stream):
+    def getParametric(self, stream, process_time=None):
         """
         Creates a dictionary of parametric data for one station/stream.
 
         Args:
             stream (obspy.core.stream.Stream): Stream of one stations data.
+            process_time (str): Processing time formatted with TIMEFMT.
+                    Default is None, which uses the current UTC time.
 
         Returns:
             dictionary: Parametric data for one station/stream.
         """
         #TODO add Fault and distances properties
-        lon = stream[0].stats.coordinates.longitude
-        lat = stream[0].stats.coordinates.latitude
-        channels = self._cleanStats(self.getChannelsMetadata(stream))
-        station = stream[0].stats.station
-        pgms = copy.deepcopy(self.station_dict[station].pgms)
+        stats = stream[0].stats
+        coordinates = stats.coordinates
+        lon = coordinates.longitude
+        lat = coordinates.latitude
+        channels = self.getChannelsMetadata(stream)
+        station = stats.station
+        pgms = self._station_dict[station].pgms
         # Set properties
         properties = {}
         properties['channels'] = channels
         properties['pgms'] = pgms
-        properties['process_time'] = datetime.datetime.utcnow().strftime(TIMEFMT)
-        properties = self._cleanStats(properties)
+        if process_time is None:
+            process_time = datetime.datetime.utcnow().strftime(TIMEFMT)
+        properties['process_time'] = process_time
         # create geojson structure
         json = {"type": "Feature",
                 "geometry": {"type": "Point",
                              "coordinates": [lon, lat]},
                      "properties": properties
                 }
+        # Clean everything, including NaN coordinates, in a single pass
+        json = self._cleanStats(json)
         return json
 
     def getStationDataframe(self, station_key):
@@ -288,30 +336,26 @@ class EventSummary(object):
             Exception: If no station_dictionary is set.
             KeyError: If the station is not in the station dictionaryself.
         """
-        if self.station_dict is None:
+        if self._station_dict is None:
             raise Exception('The station dictionary has not been set. Use '
                 'setStationDictionary.')
-        elif station_key not in self.station_dict:
+        elif station_key not in self._station_dict:
             raise KeyError('Not an available station %r.' % station_key)
-        station = self.station_dict[station_key]
-        pgms = copy.deepcopy(station.pgms)
+        station = self._station_dict[station_key]
+        pgms = station.pgms
+        imt_keys = sorted(pgms)
+        imc_keys = sorted(pgms[imt_keys[0]])
+        pgm_matrix = _pgm_matrix(pgms, imc_keys, imt_keys)
+        # Give each column its own typed array so the frame is column-major
         dataframe_dict = OrderedDict()
-        dataframe_dict[''] = []
-        imt_keys = np.sort([val for val in pgms])
-        imc_keys = np.sort([val for val in pgms[imt_keys[0]]])
-        for imc_key in imc_keys:
-            dataframe_dict[imc_key] = []
-        for imt_key in imt_keys:
-            dataframe_dict[''] += [imt_key]
-        # Create dataframe
-        for imc_key in imc_keys:
-            for imt_key in imt_keys:
-                dataframe_dict[imc_key] += [pgms[imt_key][imc_key]]
+        dataframe_dict[''] = np.array(imt_keys, dtype=object)
+        for idx, imc_key in enumerate(imc_keys):
+            dataframe_dict[imc_key] = _pgm_array(pgm_matrix[idx])
         # Create pandas dataframe
-        dataframe = pd.DataFrame(data=dataframe_dict)
+        dataframe = pd.DataFrame(data=dataframe_dict, copy=False)
         return dataframe
 
-    def setStationDictionary(self, imcs=None, imts=None):
+    def setStationDictionary(self, imcs=None, imts=None, nprocs=1):
         """
         Calculate the station summaries and set the dictionary.
 
@@ -320,9 +364,16 @@ class EventSummary(object):
                     is None. If none imclist from config is used.
             imts (list): List of intensity measurement types (str). Default
                     is None. If None imtlist from config is used.
+            nprocs (int): Number of processes used to calculate the station
+                    summaries. Default is 1, which calculates the summaries
+                    serially in this process. None uses the number of CPUs.
 
         Notes:
-            Requires that corrected_streams is set.
+            Requires that corrected_streams is set. With more than one
+            process, each stream and StationSummary is pickled between
+            processes, warnings raised while summarizing are not shown to
+            the caller, and scripts must guard their entry point with
+            if __name__ == '__main__' on platforms that spawn workers.
 
         Raises:
             Exception: If corrected_streams is not set.
@@ -334,15 +385,22 @@ class EventSummary(object):
         if imts is None:
             imts = config['imtlist']
 
-        if self.corrected_streams is None:
+        if self._corrected_streams is None:
             raise Exception('Processed streams are required to create a '
                     'StationSummary object and create the dictionary.')
-        station_dict = OrderedDict()
-        for station in self.corrected_streams:
-            stream = self.corrected_streams[station]
-            station_dict[station] = StationSummary.from_stream(stream,
-                    imcs, imts)
-        self._station_dict = station_dict
+        station_codes = list(self._corrected_streams)
+        streams = [self._corrected_streams[station]
+                for station in station_codes]
+        summarize_stream = functools.partial(_summarize_stream, imcs=imcs,
+                imts=imts)
+        # Station summaries are independent and CPU bound, so they can be
+        # spread over processes when asked for, like process does
+        if nprocs == 1 or len(streams) < 2:
+            summaries = [summarize_stream(stream) for stream in streams]
+        else:
+            with ProcessPoolExecutor(max_workers=nprocs) as executor:
+                summaries = list(executor.map(summarize_stream, streams))
+        self._station_dict = OrderedDict(zip(station_codes, summaries))
 
     @property
     def stations(self):
@@ -352,8 +410,7 @@ class EventSummary(object):
         Returns:
             list: List of station codes (str)
         """
-        stations = [station for station in self.uncorrected_streams]
-        return stations
+        return list(self._uncorrected_streams)
 
     @property
     def station_dict(self):
@@ -362,10 +419,17 @@ class EventSummary(object):
 
         Returns:
             dictionary: StationSummary objects for each station.
+
+        Notes:
+            The dictionary is a shallow copy. The StationSummary objects are
+            shared with this EventSummary and should not be modified in place.
         """
-        return copy.deepcopy(self._station_dict)
+        if self._station_dict is None:
+            return None
+        return copy.copy(self._station_dict)
 
-    def process(self, config=None, station=None, event_time=None, epi_dist=None):
+    def process(self, config=None, station=None, event_time=None, epi_dist=None,
+            nprocs=1):
         """Process all stations in the EventSummary.
 
         Args:
@@ -374,11 +438,20 @@ class EventSummary(object):
                     get_config to find the user defined config or the default.
             station (str): Station to process. Default is None. None results in
                     all stations being processed.
+            nprocs (int): Number of processes used when processing all
+                    stations. Default is 1, which processes the stations
+                    serially in this process. None uses the number of CPUs.
+
+        Notes:
+            With more than one process, each stream is pickled to a worker
+            process and back, warnings raised while processing are not
+            shown to the caller, and scripts must guard their entry point
+            with if __name__ == '__main__' on platforms that spawn workers.
 
         Raises:
             Exception: If there are not unprocessed streams.
         """
-        if self.uncorrected_streams is None:
+        if self._uncorrected_streams is None:
             raise Exception('There are no unprocessed streams to process.')
 
         # get config if none is supplied
@@ -386,24 +459,33 @@ class EventSummary(object):
             config = get_config()
 
         if station is None:
-            corrected_streams = {}
-            for station_code in self.uncorrected_streams:
-                stream = self.uncorrected_streams[station_code]
-                processed_stream = process_config(stream,
-                        config=config, event_time=event_time, epi_dist=epi_dist)
-                corrected_streams[station_code] = processed_stream
+            station_codes = list(self._uncorrected_streams)
+            streams = [self._uncorrected_streams[station_code]
+                    for station_code in station_codes]
+            process_stream = functools.partial(process_config,
+                    config=config, event_time=event_time, epi_dist=epi_dist)
+            # Stations are processed independently, so spread them over
+            # processes to get around the GIL
+            if nprocs == 1 or len(streams) < 2:
+                processed_streams = [process_stream(stream)
+                        for stream in streams]
+            else:
+                with ProcessPoolExecutor(max_workers=nprocs) as executor:
+                    processed_streams = list(executor.map(process_stream,
+                            streams))
+            corrected_streams = dict(zip(station_codes, processed_streams))
             self.corrected_streams = corrected_streams
         else:
-            if self.corrected_streams is None:
+            if self._corrected_streams is None:
                 warnings.warn('%r cannot be reprocessed, since the '
                 'processed_streams dictionary has not been populated. Process '
                 'all stream, then this station can be reprocessed.' % station)
                 return
-            if station not in self.uncorrected_streams:
+            if station not in self._uncorrected_streams:
                 warnings.warn('%r is not an available station. Processing will '
                         'not continue.' % station)
                 return
-            stream = self.uncorrected_streams[station]
+            stream = self._uncorrected_streams[station]
             corrected_streams = self.corrected_streams
             processed_stream = process_config(stream,
                     config=config, event_time=event_time, epi_dist=epi_dist)
@@ -417,9 +499,14 @@ class EventSummary(object):
 
         Returns:
             dictionary: Uncorrected streams (obspy.core.stream.Stream)
+
+        Notes:
+            The dictionary is a shallow copy. The streams are shared with this
+            EventSummary and should not be modified in place.
         """
-        streams = copy.deepcopy(self._uncorrected_streams)
-        return streams
+        if self._uncorrected_streams is None:
+            return None
+        return copy.copy(self._uncorrected_streams)
 
     @uncorrected_streams.setter
     def uncorrected_streams(self, streams):
@@ -428,8 +515,13 @@ class EventSummary(object):
 
         Args:
             streams (dictionary): Uncorrected streams (obspy.core.stream.Stream)
+
+        Notes:
+            The dictionary is stored without copying, so the EventSummary
+            takes ownership of it and its streams.
         """
-        if self.station_dict is None or len(streams) == len(self.station_dict):
+        if (self._station_dict is None or
+                len(streams) == len(self._station_dict)):
             self._uncorrected_streams = streams
         else:
             warnings.warn('Stream dictionary is not the same length as the '
@@ -451,14 +543,16 @@ class EventSummary(object):
         filename = today + '_flatfile%s.csv'
         path = os.path.join(output_directory, filename)
         path = self._correctPath(path)
-        dataframe.to_csv(path, mode = 'w', index=False)
+        dataframe.to_csv(path, mode='w', index=False)
 
-    def writeParametric(self, directory):
+    def writeParametric(self, directory, nprocs=None):
         """
         Writes timeseries data to a specified format.
 
         Args:
             directory (str): Path to output directory.
+            nprocs (int): Maximum number of files written concurrently.
+                    Default is None, which lets ThreadPoolExecutor decide.
 
         Notes:
             Obspy are listed in the documentation for the write method:
@@ -469,21 +563,13 @@ class EventSummary(object):
         # Create directory if it doesn't exist
         if not os.path.exists(directory):
                 os.makedirs(directory)
-        # Output parametric should be a record of the corrected streams
-        # unless no corrected streams exist
-        if self.corrected_streams is not None:
-            streams = self.corrected_streams
-        else:
-            streams = self.uncorrected_streams
-        for station in streams:
-            stream = streams[station]
-            starttime = stream[0].stats['starttime'].strftime("%Y%m%d%H%M%S")
-            extension = '.json'
-            file = station + starttime + extension
-            file_path = os.path.join(directory, file)
-            geojson = self.getParametric(stream)
-            with open(file_path,'wt') as f:
-                json.dump(geojson, f)
+        # All files written together share one processing time
+        process_time = datetime.datetime.utcnow().strftime(TIMEFMT)
+        streams = self._getParametricStreams()
+        jobs = [functools.partial(self._writeParametricFile, directory,
+                station, streams[station], process_time)
+                for station in streams]
+        self._runWriteJobs(jobs, nprocs)
 
     def writeStationTable(self, dataframe, output_directory, station):
         """
@@ -501,9 +587,10 @@ class EventSummary(object):
         filename = station + '%s.csv'
         path = os.path.join(output_directory, filename)
         path = self._correctPath(path)
-        dataframe.to_csv(path, mode = 'w', index=False)
+        dataframe.to_csv(path, mode='w', index=False)
 
-    def writeTimeseries(self, directory, file_format, include_json=True):
+    def writeTimeseries(self, directory, file_format, include_json=True,
+            nprocs=None):
         """
         Writes timeseries data to a specified format.
 
@@ -512,6 +599,8 @@ class EventSummary(object):
             file_format (str): One of the accepted obspy time series formats.
             include_json (bool): Write geojson file at the same time. Defaults
                     to True.
+            nprocs (int): Maximum number of files written concurrently.
+                    Default is None, which lets ThreadPoolExecutor decide.
         Notes:
             Obspy are listed in the documentation for the write method:
             https://docs.obspy.org/packages/autogen/obspy.core.stream.Stream.write.html.
@@ -523,16 +612,18 @@ class EventSummary(object):
         if not os.path.exists(directory):
                 os.makedirs(directory)
         # Output streams should be a record of the uncorrected streams
-        for station in self.uncorrected_streams:
-            stream = self.uncorrected_streams[station]
-            starttime = stream[0].stats['starttime'].strftime("%Y%m%d%H%M%S")
-            extension = '.' + file_format
-            file = station + starttime + extension
-            file_path = os.path.join(directory, file)
-            stream.write(file_path, file_format)
+        streams = self._uncorrected_streams
+        jobs = [functools.partial(self._writeTimeseriesFile, directory,
+                station, streams[station], file_format)
+                for station in streams]
         # parametric data will be required to use from_products
         if include_json is True:
-            self.writeParametric(directory)
+            process_time = datetime.datetime.utcnow().strftime(TIMEFMT)
+            parametric_streams = self._getParametricStreams()
+            jobs += [functools.partial(self._writeParametricFile, directory,
+                    station, parametric_streams[station], process_time)
+                    for station in parametric_streams]
+        self._runWriteJobs(jobs, nprocs)
 
     def _cleanStats(self, stats):
         """
@@ -543,15 +634,38 @@ class EventSummary(object):
 
         Returns:
             dictionary: Dictionary of cleaned stats.
-        """
-        for key, value in stats.items():
-            if isinstance(value, (dict, AttribDict)):
-                stats[key] = dict(self._cleanStats(value))
-            elif isinstance(value, UTCDateTime):
-                stats[key] = value.strftime(TIMEFMT)
-            elif isinstance(value, float) and np.isnan(value) or value == '':
-                stats[key] = 'null'
-        return stats
+
+        Notes:
+            The input is not modified. Nested dictionaries, lists and tuples
+            are rebuilt as the cleaned values are collected, so the result
+            shares no containers with the input and can be serialized
+            directly. NaN and infinite floats and empty strings are
+            replaced with 'null'.
+        """
+        cleaned = {}
+        # Walk nested containers with a stack of (source, cleaned) pairs
+        stack = [(stats, cleaned)]
+        while stack:
+            source, target = stack.pop()
+            if isinstance(source, (list, tuple)):
+                items = enumerate(source)
+            else:
+                items = source.items()
+            for key, value in items:
+                if isinstance(value, (dict, AttribDict)):
+                    target[key] = {}
+                    stack.append((value, target[key]))
+                elif isinstance(value, (list, tuple)):
+                    target[key] = [None] * len(value)
+                    stack.append((value, target[key]))
+                elif isinstance(value, UTCDateTime):
+                    target[key] = value.strftime(TIMEFMT)
+                elif ((isinstance(value, float) and not math.isfinite(value)) or
+                        (isinstance(value, str) and value == '')):
+                    target[key] = 'null'
+                else:
+                    target[key] = value
+        return cleaned
 
     def _correctPath(self, path):
         """
@@ -563,12 +677,132 @@ class EventSummary(object):
         Notes:
             This is only used by plot and table writers.
         """
-        # Export csv
-        file_number = ''
-        while os.path.isfile(path % file_number):
-            last = path % file_number
-            file_number = int(file_number or 0) + 1
-        path = path % file_number
-        if file_number != "":
-            print('%r already exists, writing to %r.' % (last, path))
-        return path
+        # List the directory once rather than checking each candidate name
+        directory, filename = os.path.split(path)
+        try:
+            existing = set(os.listdir(directory or os.curdir))
+        except OSError:
+            existing = set()
+        # The first file has no number, later ones count up from 1
+        file_number = 0
+        while filename % (file_number or '') in existing:
+            file_number += 1
+        new_path = path % (file_number or '')
+        if file_number:
+            last = path % (file_number - 1 or '')
+            print('%r already exists, writing to %r.' % (last, new_path))
+        return new_path
+
+    def _getFileTimestamp(self, stream):
+        """
+        Helper to format a stream's start time for output file names.
+
+        Args:
+            stream (obspy.core.stream.Stream): Stream of one stations data.
+
+        Returns:
+            str: Start time of the first trace as YYYYmmddHHMMSS.
+        """
+        starttime = stream[0].stats['starttime']
+        return '{:04d}{:02d}{:02d}{:02d}{:02d}{:02d}'.format(starttime.year,
+                starttime.month, starttime.day, starttime.hour,
+                starttime.minute, starttime.second)
+
+    def _getFlatfileColumns(self, station):
+        """
+        Helper to gather the flatfile columns for one station.
+
+        Args:
+            station (pgm.station_summary.StationSummary): Station summary.
+
+        Returns:
+            OrderedDict: Flatfile headers mapped to 1-D numpy arrays with one
+                    element per channel/component.
+        """
+        pgms = station.pgms
+        imt_keys = sorted(pgms)
+        imc_keys = sorted(pgms[imt_keys[0]])
+        nrows = len(imc_keys)
+        pgm_matrix = _pgm_matrix(pgms, imc_keys, imt_keys)
+        # Metadata is the same for every row of the station
+        stats = station.stream[0].stats
+        starttime = stats['starttime']
+        mody = '{:02d}{:02d}'.format(starttime.month, starttime.day)
+        hrmn = '{:02d}{:02d}'.format(starttime.hour, starttime.minute)
+        dataframe_dict = OrderedDict()
+        dataframe_dict['YEAR'] = np.full(nrows, starttime.year)
+        dataframe_dict['MODY'] = np.full(nrows, mody, dtype=object)
+        dataframe_dict['HRMN'] = np.full(nrows, hrmn, dtype=object)
+        dataframe_dict['Station Name'] = np.full(nrows,
+                stats['standard']['station_name'], dtype=object)
+        dataframe_dict['Station ID  No.'] = np.full(nrows, stats['station'],
+                dtype=object)
+        dataframe_dict['Station Latitude'] = np.full(nrows,
+                stats['coordinates']['latitude'])
+        dataframe_dict['Station Longitude'] = np.full(nrows,
+                stats['coordinates']['longitude'])
+        dataframe_dict['Channel'] = np.array(imc_keys, dtype=object)
+        for idx, imt_key in enumerate(imt_keys):
+            dataframe_dict[imt_key] = _pgm_array(pgm_matrix[:, idx])
+        return dataframe_dict
+
+    def _getParametricStreams(self):
+        """
+        Helper to choose the streams recorded in parametric files.
+
+        Returns:
+            dictionary: Corrected streams, or the uncorrected streams if no
+                    corrected streams exist.
+        """
+        # Output parametric should be a record of the corrected streams
+        # unless no corrected streams exist
+        if self._corrected_streams is not None:
+            return self._corrected_streams
+        return self._uncorrected_streams
+
+    def _runWriteJobs(self, jobs, nprocs=None):
+        """
+        Helper to run independent file writes concurrently.
+
+        Args:
+            jobs (list): Callables that each write one file.
+            nprocs (int): Maximum number of files written concurrently.
+                    Default is None, which lets ThreadPoolExecutor decide.
+        """
+        # Each job writes its own file, so the writes can overlap
+        with ThreadPoolExecutor(max_workers=nprocs) as executor:
+            list(executor.map(lambda job: job(), jobs))
+
+    def _writeParametricFile(self, directory, station, stream, process_time):
+        """
+        Helper to write the parametric geojson file for one station.
+
+        Args:
+            directory (str): Path to output directory.
+            station (str): Station code.
+            stream (obspy.core.stream.Stream): Stream of one stations data.
+            process_time (str): Processing time formatted with TIMEFMT.
+        """
+        starttime = self._getFileTimestamp(stream)
+        extension = '.json'
+        file = station + starttime + extension
+        file_path = os.path.join(directory, file)
+        geojson = self.getParametric(stream, process_time)
+        with open(file_path, 'wb') as f:
+            f.write(dumps_json(geojson))
+
+    def _writeTimeseriesFile(self, directory, station, stream, file_format):
+        """
+        Helper to write the time series file for one station.
+
+        Args:
+            directory (str): Path to output directory.
+            station (str): Station code.
+            stream (obspy.core.stream.Stream): Stream of one stations data.
+            file_format (str): One of the accepted obspy time series formats.
+        """
+        starttime = self._getFileTimestamp(stream)
+        extension = '.' + file_format
+        file = station + starttime + extension
+        file_path = os.path.join(directory, file)
+        stream.write(file_path, file_format)
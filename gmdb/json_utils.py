@@ -0,0 +1,66 @@
+# stdlib imports
+import json
+
+# third party imports
+import numpy as np
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(data):
+    """Serialize to JSON bytes, using orjson when it is installed.
+
+    Args:
+        data: JSON serializable object, which may contain numpy scalars and
+                arrays.
+
+    Returns:
+        bytes: UTF-8 encoded JSON document.
+
+    Notes:
+        Both backends produce the same document, apart from whitespace.
+        Values orjson cannot serialize, such as dictionaries with non-str
+        keys, are written with the stdlib json module. Non-finite floats
+        must be cleaned by the caller, as getParametric does, since orjson
+        writes them as null where the stdlib json module writes NaN or
+        Infinity.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass
+    return json.dumps(data, default=_to_builtin).encode('utf-8')
+
+
+def loads_json(data):
+    """Deserialize JSON bytes, using orjson when it is installed.
+
+    Args:
+        data (bytes): UTF-8 encoded JSON document.
+
+    Returns:
+        Deserialized object.
+
+    Notes:
+        orjson rejects NaN and Infinity, which the stdlib json module writes
+        for non-finite floats, so documents containing them are parsed with
+        the stdlib json module instead.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data.decode('utf-8'))
+
+
+def _to_builtin(value):
+    """Convert numpy scalars and arrays for the stdlib json module, matching
+    what orjson writes for them."""
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError('Object of type %s is not JSON serializable' %
+            type(value).__name__)
@@ -1,7 +1,6 @@
 # stdlib imports
 import tempfile
 import shutil
-import json
 import os.path
 
 # third party imports
@@ -10,6 +9,7 @@ from libcomcat.search import get_event_by_id
 
 # local imports
 from gmdb.constants import JSON_FILE, PRODUCT_TYPE
+from gmdb.json_utils import dumps_json, loads_json
 
 
 def store_params(param_data, config, eventsource, eventsourcecode):
@@ -37,14 +37,19 @@ def store_params(param_data, config, eventsource, eventsourcecode):
     props['eventsourcecode'] = eventsourcecode
     props['code'] = eventsource + eventsourcecode
     props['type'] = PRODUCT_TYPE
+    # Each call stages its file in its own folder, since the file name is
+    # the product content name and concurrent calls must not share it
     tdir = tempfile.mkdtemp()
-    jsonfile = os.path.join(tdir, JSON_FILE)
-    with open(jsonfile, 'wt') as jfile:
-        json.dump(param_data, jfile)
-        sender = PDLSender(properties=props, local_files=[jsonfile],
-                           product_properties={'name': 'test'})
-    nfiles, msg = sender.send()
-    shutil.rmtree(tdir)
+    try:
+        jsonfile = os.path.join(tdir, JSON_FILE)
+        # Encode the whole document up front and write it in one call
+        with open(jsonfile, 'wb') as jfile:
+            jfile.write(dumps_json(param_data))
+            sender = PDLSender(properties=props, local_files=[jsonfile],
+                               product_properties={'name': 'test'})
+        nfiles, msg = sender.send()
+    finally:
+        shutil.rmtree(tdir)
     return (nfiles, msg)
 
 
@@ -66,7 +71,7 @@ def get_params(eventsource, eventsourcecode, comcat_host=None):
             return None
         sm_params = detail.getProducts(PRODUCT_TYPE)[0]
         data, url = sm_params.getContentBytes(JSON_FILE)
-        jdict = json.loads(data.decode('utf8'))
+        jdict = loads_json(data)
         return jdict
 
     except Exception as e:
@@ -1,22 +1,34 @@
-# third party imports
-from paramiko import SSHClient
+# stdlib imports
+import posixpath
+import stat
+import weakref
+
+# SFTP sessions opened on each SSHClient, reused across calls
+_SFTP_CLIENTS = weakref.WeakKeyDictionary()
 
 
 def create_remote_folder(ssh, remote_folder):
+    """Create remote folder (and any missing parents) if it does not exist.
+
+    Args:
+        ssh: SSHClient instance.
+        remote_folder: Remote folder to copy local files to.
+
+    Returns:
+        bool: True indicates that remote folder exists or was created,
+              False otherwise.
+    """
+    sftp = _get_sftp(ssh)
     exists, isdir = check_remote_folder(ssh, remote_folder)
-    chk_cmd1 = '[ -d %s ];echo $?' % remote_folder
     if not isdir:
-        if exists:
-            rm_cmd = 'rm %s' % remote_folder
-            stdin, stdout, stderr = ssh.exec_command(rm_cmd)
-            stdin, stdout, stderr = ssh.exec_command(chk_cmd1)
-            exists = not int(stdout.read().decode('utf-8').strip())
-        if not exists:
-            mk_cmd = 'mkdir -p %s' % remote_folder
-            stdin, stdout, stderr = ssh.exec_command(mk_cmd)
-            exists, isdir = check_remote_folder(ssh, remote_folder)
-            if not isdir:
-                return False
+        try:
+            if exists:
+                sftp.remove(remote_folder)
+            # A successful mkdir already guarantees the folder exists, so
+            # there is no need to check it again afterwards
+            _make_dirs(sftp, remote_folder)
+        except IOError:
+            return False
     return True
 
 
@@ -31,17 +43,11 @@ def delete_remote_folder(ssh, remote_folder):
         bool: True indicates that remote folder existed and was deleted,
               False otherwise.
     """
-    exists, isdir = check_remote_folder(ssh, remote_folder)
-    chk_cmd1 = '[ -d %s ];echo $?' % remote_folder
-    if isdir and exists:
-        rm_cmd = 'rm -rf %s' % remote_folder
-        stdin, stdout, stderr = ssh.exec_command(rm_cmd)
-        stdin, stdout, stderr = ssh.exec_command(chk_cmd1)
-        exists = not int(stdout.read().decode('utf-8').strip())
-    else:
-        return False
-
-    return True
+    # SFTP has no recursive delete, so check, delete and verify in a single
+    # shell command rather than walking the tree
+    rm_cmd = '[ -d %s ] && rm -rf %s && [ ! -e %s ]' % ((remote_folder,) * 3)
+    stdin, stdout, stderr = ssh.exec_command(rm_cmd)
+    return stdout.channel.recv_exit_status() == 0
 
 
 def check_remote_folder(ssh, remote_folder):
@@ -55,16 +61,17 @@ def check_remote_folder(ssh, remote_folder):
         tuple: Contains two booleans -- (does a file or directory of this name
                exist, is it a directory?)
     """
-    chk_cmd1 = '[ -e %s ];echo $?' % remote_folder
-    stdin, stdout, stderr = ssh.exec_command(chk_cmd1)
-    exists = not int(stdout.read().decode('utf-8').strip())
-    chk_cmd2 = '[ -d %s ];echo $?' % remote_folder
-    stdin, stdout, stderr = ssh.exec_command(chk_cmd2)
-    isdir = not int(stdout.read().decode('utf-8').strip())
-    return (exists, isdir)
+    sftp = _get_sftp(ssh)
+    try:
+        st = sftp.stat(remote_folder)
+    except IOError:
+        return (False, False)
+    return (True, stat.S_ISDIR(st.st_mode))
 
 
 def get_ssh_connection(remote_host, keyfile):
+    # paramiko is slow to import and only needed once a connection is made
+    from paramiko import SSHClient
     ssh = SSHClient()
     # load hosts found in ~/.ssh/known_hosts
     # should we not assume that the user has these configured already?
@@ -77,3 +84,41 @@ def get_ssh_connection(remote_host, keyfile):
         fmt = 'Could not connect with private key file %s: "%s"'
         raise Exception(fmt % (keyfile, str(obj)))
     return ssh
+
+
+def _get_sftp(ssh):
+    """Get an SFTP session for an SSH connection, opening one if needed.
+
+    Args:
+        ssh: SSHClient instance.
+
+    Returns:
+        SFTPClient: SFTP session on the SSH connection.
+    """
+    sftp = _SFTP_CLIENTS.get(ssh)
+    if sftp is None or sftp.get_channel().closed:
+        sftp = ssh.open_sftp()
+        _SFTP_CLIENTS[ssh] = sftp
+    return sftp
+
+
+def _make_dirs(sftp, remote_folder):
+    """Create a missing remote folder and any missing parent folders.
+
+    Args:
+        sftp: SFTPClient instance.
+        remote_folder: Remote folder to create.
+    """
+    # The caller has already established that remote_folder does not exist
+    folder = remote_folder.rstrip('/')
+    missing = [folder]
+    folder = posixpath.dirname(folder)
+    while folder and folder != '/':
+        try:
+            sftp.stat(folder)
+            break
+        except IOError:
+            missing.append(folder)
+            folder = posixpath.dirname(folder)
+    for folder in reversed(missing):
+        sftp.mkdir(folder)
@@ -1,4 +1,4 @@
-from gmdb.config import _validate_config
+from gmdb.config import _validate_config, get_config, invalidate_config_cache
 
 def test_config():
     config = {
@@ -74,5 +74,17 @@ def test_config():
         success = False
     assert success == False
 
+def test_get_config_cache():
+    config1 = get_config()
+    config2 = get_config()
+    assert config1 == config2
+    # Callers should not be able to modify the cached config
+    assert config1 is not config2
+    config1['imtlist'] = []
+    assert get_config()['imtlist'] == config2['imtlist']
+    invalidate_config_cache()
+    assert get_config() == config2
+
 if __name__ == '__main__':
     test_config()
+    test_get_config_cache()
@@ -1,9 +1,8 @@
 #!/usr/bin/env python
 
 # stdlib imports
-from collections import OrderedDict
+import copy
 import os
-import shutil
 import tempfile
 import warnings
 
@@ -13,63 +12,91 @@ import numpy as np
 # local imports
 from gmdb.event_summary import EventSummary
 
+HOMEDIR = os.path.dirname(os.path.abspath(__file__))
+INPUT_DIRECTORY = os.path.join(HOMEDIR, '..', 'data')
+TARGET_STATIONS = np.sort(np.asarray(['EAS', 'ECU', 'EDH', 'WTMC', 'AOM001']))
+TARGET_MODYS = np.sort(np.asarray(['0206', '0206', '0206', '0206', '0206',
+        '0206', '0206', '0206', '0206', '0206', '0206', '0206', '1113',
+        '1113', '1113', '1113', '0124', '0124', '0124', '0124']))
+TARGET_NAMES = np.sort(np.asarray(['Anshuo', 'Anshuo', 'Anshuo', 'Anshuo',
+        'Chulu', 'Chulu', 'Chulu', 'Chulu', 'Donghe', 'Donghe', 'Donghe',
+        'Donghe', 'Te_Mara_Farm_Waiau', 'Te_Mara_Farm_Waiau',
+        'Te_Mara_Farm_Waiau', 'Te_Mara_Farm_Waiau', '', '', '', '']))
+TARGET_IDS = np.sort(np.asarray(['EAS', 'EAS', 'EAS', 'EAS', 'ECU', 'ECU',
+        'ECU', 'ECU', 'EDH', 'EDH', 'EDH', 'EDH', 'WTMC', 'WTMC', 'WTMC',
+        'WTMC', 'AOM001', 'AOM001', 'AOM001', 'AOM001']))
+
 
 # stdlb import
 def test_eventsummary():
-    homedir = os.path.dirname(os.path.abspath(__file__))
-    input_directory = os.path.join(homedir, '..', 'data')
     # test EventSummary object
-    event = EventSummary.fromFiles(input_directory,
+    event = EventSummary.fromFiles(INPUT_DIRECTORY,
             ['channels', 'greater_of_two_horizontals'],
             ['PGA', 'PGV', 'SA(0.3)', 'SA(1.0)', 'SA(3.0)'])
 
     # test EventSummary object from config
-    event_config = EventSummary.fromFiles(input_directory)
+    event_config = EventSummary.fromFiles(INPUT_DIRECTORY)
 
     assert event_config.station_dict['EAS'].pgms == event.station_dict['EAS'].pgms
 
+    # test processing and summarizing stations in worker processes
+    event_parallel = EventSummary.fromFiles(INPUT_DIRECTORY,
+            ['channels', 'greater_of_two_horizontals'],
+            ['PGA', 'PGV', 'SA(0.3)', 'SA(1.0)', 'SA(3.0)'], nprocs=2)
+    for station in event.stations:
+        assert (event_parallel.station_dict[station].pgms ==
+                event.station_dict[station].pgms)
+    event_parallel.process(nprocs=2)
+    event_parallel.setStationDictionary(
+            ['channels', 'greater_of_two_horizontals'],
+            ['PGA', 'PGV', 'SA(0.3)', 'SA(1.0)', 'SA(3.0)'], nprocs=2)
+    for station in event.stations:
+        assert (event_parallel.station_dict[station].pgms ==
+                event.station_dict[station].pgms)
+
     assert type(event) == EventSummary
-    target_stations = np.asarray(['EAS', 'ECU', 'EDH', 'WTMC', 'AOM001'])
     stations = np.asarray(event.stations)
-    np.testing.assert_array_equal(np.sort(stations), np.sort(target_stations))
+    np.testing.assert_array_equal(np.sort(stations), TARGET_STATIONS)
 
     # test flatfile
-    flatfile = event.getFlatfileDataframe().to_dict(into=OrderedDict)
-    target_modys = np.sort(np.asarray(['0206', '0206', '0206', '0206', '0206',
-            '0206', '0206', '0206', '0206', '0206', '0206', '0206', '1113',
-            '1113', '1113', '1113', '0124', '0124', '0124', '0124']))
-    mody = flatfile['MODY']
-    modys = np.sort(np.asarray([mody[key] for key in mody]))
-    np.testing.assert_array_equal(modys, target_modys)
-    target_names = np.sort(np.asarray(['Anshuo', 'Anshuo', 'Anshuo', 'Anshuo',
-            'Chulu', 'Chulu', 'Chulu', 'Chulu', 'Donghe', 'Donghe', 'Donghe',
-            'Donghe', 'Te_Mara_Farm_Waiau', 'Te_Mara_Farm_Waiau',
-            'Te_Mara_Farm_Waiau', 'Te_Mara_Farm_Waiau', '', '', '', '']))
-    name = flatfile['Station Name']
-    names = np.sort(np.asarray([name[key] for key in name]))
-    np.testing.assert_array_equal(names, target_names)
-    target_ids = np.sort(np.asarray(['EAS', 'EAS', 'EAS', 'EAS', 'ECU', 'ECU',
-            'ECU', 'ECU', 'EDH', 'EDH', 'EDH', 'EDH', 'WTMC', 'WTMC', 'WTMC',
-            'WTMC', 'AOM001', 'AOM001', 'AOM001', 'AOM001']))
-    st_id = flatfile['Station ID  No.']
-    ids = np.sort(np.asarray([st_id[key] for key in st_id]))
+    flatfile = event.getFlatfileDataframe()
+    modys = np.sort(flatfile['MODY'].values)
+    np.testing.assert_array_equal(modys, TARGET_MODYS)
+    names = np.sort(flatfile['Station Name'].values)
+    np.testing.assert_array_equal(names, TARGET_NAMES)
+    ids = np.sort(flatfile['Station ID  No.'].values)
+    np.testing.assert_array_equal(ids, TARGET_IDS)
 
     para_dict = event.getParametric(event.corrected_streams['AOM001'])
     target_top = np.sort(np.asarray(['type', 'geometry', 'properties']))
-    top_keys = [key for key in para_dict]
+    top_keys = list(para_dict)
     np.testing.assert_array_equal(np.sort(top_keys), target_top)
     target_properties = np.sort(np.asarray(['channels', 'process_time',
             'pgms']))
-    property_keys = [key for key in para_dict['properties']]
+    property_keys = list(para_dict['properties'])
     np.testing.assert_array_equal(np.sort(property_keys), target_properties)
     target_geometry = np.sort(np.asarray(['type', 'coordinates']))
-    geometry_keys = [key for key in para_dict['geometry']]
+    geometry_keys = list(para_dict['geometry'])
     np.testing.assert_array_equal(np.sort(geometry_keys), target_geometry)
     target_channel = np.sort(np.asarray(['stats', 'processing_parameters']))
-    channel_keys = [key for key in para_dict['properties']['channels']['HN1']]
+    channel_keys = list(para_dict['properties']['channels']['HN1'])
     np.testing.assert_array_equal(np.sort(channel_keys), target_channel)
+
+    # editing the parametric data must not change the trace stats
+    trace = event.corrected_streams['AOM001'].select(channel='HN1')[0]
+    target_processing = copy.deepcopy(trace.stats['processing_parameters'])
+    target_station = trace.stats['station']
+    channel = para_dict['properties']['channels']['HN1']
+    channel['processing_parameters']['filters'][0]['corners'] = 99
+    channel['stats']['station'] = 'EDITED'
+    assert trace.stats['processing_parameters'] == target_processing
+    assert trace.stats['station'] == target_station
     with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
+        # The stream setters and process warn about the invalid input below
+        warnings.filterwarnings('ignore',
+                message='Stream dictionary is not the same length')
+        warnings.filterwarnings('ignore',
+                message='.* is not an available station')
         try:
             event.getStationDataframe('INVALID')
             success = True
@@ -89,31 +116,33 @@ def test_eventsummary():
     # Test reprocessing station
     event.process(station='WTMC')
 
-    tmpdir = tempfile.mkdtemp()
-    flatfile = event.getFlatfileDataframe()
-    station = event.station_dict.popitem(last=False)[0]
-    df = event.getStationDataframe(station)
-    event.writeStationTable(df, tmpdir, station)
-    event.writeStationTable(df, tmpdir, station)
-    event.writeFlatfile(flatfile, tmpdir)
-    event.writeFlatfile(flatfile, tmpdir)
-    shutil.rmtree(tmpdir)
-
-    tmpdir = tempfile.mkdtemp()
-    event.writeTimeseries(tmpdir, 'MSEED')
-    prods = EventSummary.fromProducts(tmpdir)
-    shutil.rmtree(tmpdir)
-
-    # FileNotFoundError with missing parametric data
-    tmpdir = tempfile.mkdtemp()
-    try:
-        event.writeTimeseries(tmpdir, 'MSEED', False)
-        prods = EventSummary.fromProducts(tmpdir)
-        success = True
-    except FileNotFoundError:
-        success = False
-    assert success == False
-    shutil.rmtree(tmpdir)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        table_directory = os.path.join(tmpdir, 'tables')
+        flatfile = event.getFlatfileDataframe()
+        station = next(iter(event.station_dict))
+        df = event.getStationDataframe(station)
+        event.writeStationTable(df, table_directory, station)
+        event.writeStationTable(df, table_directory, station)
+        event.writeFlatfile(flatfile, table_directory)
+        event.writeFlatfile(flatfile, table_directory)
+
+        product_directory = os.path.join(tmpdir, 'products')
+        event.writeTimeseries(product_directory, 'MSEED')
+        prods = EventSummary.fromProducts(product_directory)
+
+        # FileNotFoundError with missing parametric data, which a single
+        # station is enough to trigger
+        single_event = EventSummary()
+        single_event.uncorrected_streams = {
+                station: event.uncorrected_streams[station]}
+        timeseries_directory = os.path.join(tmpdir, 'timeseries')
+        try:
+            single_event.writeTimeseries(timeseries_directory, 'MSEED', False)
+            prods = EventSummary.fromProducts(timeseries_directory)
+            success = True
+        except FileNotFoundError:
+            success = False
+        assert success == False
 
     # Exception with missing uncorrected_streams
     empty_event = EventSummary()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+# stdlib imports
+import math
+
+# third party imports
+import numpy as np
+
+# local imports
+import gmdb.json_utils as json_utils
+from gmdb.json_utils import dumps_json, loads_json
+
+DOCUMENT = {
+        'geometry': {'type': 'Point', 'coordinates': [np.float64(121.5),
+                np.float32(24.25)]},
+        'pgms': {'PGA': {'HN1': np.float64(0.125), 'HN2': 'null'}},
+        'array': np.array([1.0, 2.5]),
+        'count': np.int64(3),
+        'name': 'Te_Mara_Farm_Waiau'}
+
+TARGET = {
+        'geometry': {'type': 'Point', 'coordinates': [121.5, 24.25]},
+        'pgms': {'PGA': {'HN1': 0.125, 'HN2': 'null'}},
+        'array': [1.0, 2.5],
+        'count': 3,
+        'name': 'Te_Mara_Farm_Waiau'}
+
+
+def test_loads_json_nan():
+    # stdlib json writes non-finite floats as NaN and Infinity
+    parsed = loads_json(b'{"coordinates": [NaN, Infinity, -Infinity]}')
+    lon, lat, elevation = parsed['coordinates']
+    assert math.isnan(lon)
+    assert lat == float('inf')
+    assert elevation == float('-inf')
+    try:
+        loads_json(b'{"coordinates": [')
+        success = True
+    except ValueError:
+        success = False
+    assert success == False
+
+
+def test_json_backends():
+    backend = json_utils.orjson
+    try:
+        results = []
+        for orjson in (backend, None):
+            json_utils.orjson = orjson
+            results.append(loads_json(dumps_json(DOCUMENT)))
+            # orjson rejects non-str keys, stdlib json converts them
+            results.append(loads_json(dumps_json({1: {2: 'value'}})))
+    finally:
+        json_utils.orjson = backend
+    assert results[0] == TARGET
+    assert results[1] == {'1': {'2': 'value'}}
+    assert results[2:] == results[:2]
+
+
+if __name__ == '__main__':
+    test_loads_json_nan()
+    test_json_backends()
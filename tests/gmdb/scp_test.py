@@ -1,8 +1,11 @@
 #!/usr/bin/env python
 
 # stdlib imports
+import functools
 import os.path
-from datetime import datetime
+import posixpath
+import stat
+import time
 
 # local imports
 from gmdb.config import get_config
@@ -10,12 +13,126 @@ from gmdb.constants import DEFAULT_CONFIG
 from gmdb.scp import (create_remote_folder,
                       check_remote_folder,
                       get_ssh_connection,
-                      delete_remote_folder)
+                      delete_remote_folder,
+                      _get_sftp)
 
 # third party imports
 import yaml
 
 
+class FakeChannel(object):
+    def __init__(self, exit_status=0):
+        self.closed = False
+        self.exit_status = exit_status
+
+    def recv_exit_status(self):
+        return self.exit_status
+
+
+class FakeStat(object):
+    def __init__(self, mode):
+        self.st_mode = mode
+
+
+class FakeSFTP(object):
+    """Minimal SFTPClient holding remote paths in a dictionary."""
+    def __init__(self, paths):
+        self.paths = paths
+        self.channel = FakeChannel()
+
+    def get_channel(self):
+        return self.channel
+
+    def stat(self, path):
+        if path not in self.paths:
+            raise IOError('No such file: %s' % path)
+        return FakeStat(self.paths[path])
+
+    def mkdir(self, path):
+        parent = posixpath.dirname(path)
+        if path in self.paths or not stat.S_ISDIR(self.paths.get(parent, 0)):
+            raise IOError('Cannot create %s' % path)
+        self.paths[path] = stat.S_IFDIR
+
+    def remove(self, path):
+        if not stat.S_ISREG(self.paths.get(path, 0)):
+            raise IOError('Not a file: %s' % path)
+        del self.paths[path]
+
+
+class FakeStdout(object):
+    def __init__(self, exit_status):
+        self.channel = FakeChannel(exit_status)
+
+
+class FakeSSH(object):
+    """Minimal SSHClient counting the SFTP sessions it opens."""
+    def __init__(self, paths, exit_status=0):
+        self.paths = paths
+        self.exit_status = exit_status
+        self.commands = []
+        self.sessions = []
+
+    def open_sftp(self):
+        self.sessions.append(FakeSFTP(self.paths))
+        return self.sessions[-1]
+
+    def exec_command(self, command):
+        self.commands.append(command)
+        return None, FakeStdout(self.exit_status), None
+
+
+def fake_paths():
+    return {'/': stat.S_IFDIR, '/data': stat.S_IFDIR,
+            '/data/file': stat.S_IFREG}
+
+
+def test_fake_get_sftp():
+    ssh = FakeSSH(fake_paths())
+    sftp = _get_sftp(ssh)
+    assert _get_sftp(ssh) is sftp
+    assert len(ssh.sessions) == 1
+    # a closed session is replaced
+    sftp.channel.closed = True
+    assert _get_sftp(ssh) is not sftp
+    assert len(ssh.sessions) == 2
+
+
+def test_fake_check_remote_folder():
+    ssh = FakeSSH(fake_paths())
+    assert check_remote_folder(ssh, '/data') == (True, True)
+    assert check_remote_folder(ssh, '/data/file') == (True, False)
+    assert check_remote_folder(ssh, '/data/missing') == (False, False)
+
+
+def test_fake_create_remote_folder():
+    paths = fake_paths()
+    ssh = FakeSSH(paths)
+    # existing folders are left alone
+    assert create_remote_folder(ssh, '/data')
+    # missing parents are created
+    assert create_remote_folder(ssh, '/data/a/b/c')
+    for folder in ['/data/a', '/data/a/b', '/data/a/b/c']:
+        assert stat.S_ISDIR(paths[folder])
+    # a file in the way is replaced by the folder
+    assert create_remote_folder(ssh, '/data/file')
+    assert stat.S_ISDIR(paths['/data/file'])
+    # failures are reported rather than raised
+    paths['/locked'] = stat.S_IFCHR
+    assert not create_remote_folder(ssh, '/locked/folder')
+    assert len(ssh.sessions) == 1
+
+
+def test_fake_delete_remote_folder():
+    ssh = FakeSSH(fake_paths())
+    assert delete_remote_folder(ssh, '/data/tmp')
+    assert ssh.commands == [
+            '[ -d /data/tmp ] && rm -rf /data/tmp && [ ! -e /data/tmp ]']
+    ssh = FakeSSH(fake_paths(), exit_status=1)
+    assert not delete_remote_folder(ssh, '/data/tmp')
+
+
+@functools.lru_cache(maxsize=None)
 def get_remote_cfg():
     config = get_config()
     if config is None or config == DEFAULT_CONFIG:
@@ -75,7 +192,7 @@ def test_create():
 
     try:
         ssh = get_ssh_connection(remote_host, keyfile)
-        nowtime = datetime.utcnow().strftime('%Y%m%d%H%M%S')
+        nowtime = time.strftime('%Y%m%d%H%M%S', time.gmtime())
         remote_folder = '/data/tmp_%s' % nowtime
         print('Testing creation of %s on %s...' %
               (remote_folder, remote_host))
@@ -96,6 +213,10 @@ def test_create():
 
 
 if __name__ == '__main__':
+    test_fake_get_sftp()
+    test_fake_check_remote_folder()
+    test_fake_create_remote_folder()
+    test_fake_delete_remote_folder()
     test_ssh_connection()
     test_check_remote_folder()
     test_create()